@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import logging
 from typing import TYPE_CHECKING, Any, Final, Self
 
@@ -74,6 +75,27 @@ class BaseClient:
         Returns:
             dict: The response data.
         """
+        return json.loads(
+            await self._request_bytes(endpoint, use_cache, static=static, in_data=in_data)
+        )
+
+    async def _request_bytes(
+        self, endpoint: str, use_cache: bool, *, static: bool = False, in_data: bool = False
+    ) -> bytes:
+        """Make a request to the API and return the raw response body.
+
+        Lets callers hand the JSON straight to `Model.model_validate_json`, which parses
+        and validates in one pass without building an intermediate dict.
+
+        Args:
+            endpoint (str): The endpoint to request.
+            use_cache (bool): Whether to use the cache.
+            static (bool): Whether the endpoint is static data (not language specific), defaults to False.
+            in_data (bool): Whether the endpoint is in the data directory, defaults to False.
+
+        Returns:
+            bytes: The response body.
+        """
         if self._session is None:
             msg = "Call `start` before making requests."
             raise RuntimeError(msg)
@@ -98,12 +120,12 @@ class BaseClient:
             async with self._session.disabled(), self._session.get(url) as resp:
                 if resp.status != 200:
                     self._handle_error(resp.status, url)
-                data = await resp.json()
+                data = await resp.read()
         else:
             async with self._session.get(url) as resp:
                 if resp.status != 200:
                     self._handle_error(resp.status, url)
-                data = await resp.json()
+                data = await resp.read()
 
         return data
 
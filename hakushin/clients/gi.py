@@ -79,8 +79,8 @@ class GIClient(BaseClient):
             The character details object.
         """
         endpoint = f"character/{character_id}"
-        data = await self._request(endpoint, use_cache)
-        return gi.CharacterDetail(**data)
+        data = await self._request_bytes(endpoint, use_cache)
+        return gi.CharacterDetail.model_validate_json(data)
 
     async def fetch_weapons(self, *, use_cache: bool = True) -> list[gi.Weapon]:
         """Fetch all Genshin Impact weapons.
@@ -111,8 +111,8 @@ class GIClient(BaseClient):
             The weapon details object.
         """
         endpoint = f"weapon/{weapon_id}"
-        data = await self._request(endpoint, use_cache)
-        return gi.WeaponDetail(**data)
+        data = await self._request_bytes(endpoint, use_cache)
+        return gi.WeaponDetail.model_validate_json(data)
 
     async def fetch_artifact_sets(self, *, use_cache: bool = True) -> list[gi.ArtifactSet]:
         """Fetch all Genshin Impact artifact sets.
@@ -154,5 +154,5 @@ class GIClient(BaseClient):
             The artifact set details object.
         """
         endpoint = f"artifact/{set_id}"
-        data = await self._request(endpoint, use_cache)
-        return gi.ArtifactSetDetail(**data)
+        data = await self._request_bytes(endpoint, use_cache)
+        return gi.ArtifactSetDetail.model_validate_json(data)
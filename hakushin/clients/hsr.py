@@ -81,8 +81,8 @@ class HSRClient(BaseClient):
             The character details object.
         """
         endpoint = f"character/{character_id}"
-        data = await self._request(endpoint, use_cache)
-        return hsr.CharacterDetail(**data)
+        data = await self._request_bytes(endpoint, use_cache)
+        return hsr.CharacterDetail.model_validate_json(data)
 
     async def fetch_light_cones(self, *, use_cache: bool = True) -> list[hsr.LightCone]:
         """Fetch all Honkai Star Rail light cones.
@@ -116,8 +116,8 @@ class HSRClient(BaseClient):
             The light cone details object.
         """
         endpoint = f"lightcone/{light_cone_id}"
-        data = await self._request(endpoint, use_cache)
-        return hsr.LightConeDetail(**data)
+        data = await self._request_bytes(endpoint, use_cache)
+        return hsr.LightConeDetail.model_validate_json(data)
 
     async def fetch_relic_sets(self, *, use_cache: bool = True) -> list[hsr.RelicSet]:
         """Fetch all Honkai Star Rail relic sets.
@@ -160,5 +160,5 @@ class HSRClient(BaseClient):
             The relic set details object.
         """
         endpoint = f"relicset/{set_id}"
-        data = await self._request(endpoint, use_cache)
-        return hsr.RelicSetDetail(**data)
+        data = await self._request_bytes(endpoint, use_cache)
+        return hsr.RelicSetDetail.model_validate_json(data)
@@ -84,8 +84,8 @@ class ZZZClient(BaseClient):
             The character details object.
         """
         endpoint = f"character/{character_id}"
-        data = await self._request(endpoint, use_cache)
-        return zzz.CharacterDetail(**data)
+        data = await self._request_bytes(endpoint, use_cache)
+        return zzz.CharacterDetail.model_validate_json(data)
 
     async def fetch_weapons(self, *, use_cache: bool = True) -> list[zzz.Weapon]:
         """Fetch all Zenless Zone Zero weapons (w-engines).
@@ -117,8 +117,8 @@ class ZZZClient(BaseClient):
             The weapon details object.
         """
         endpoint = f"weapon/{weapon_id}"
-        data = await self._request(endpoint, use_cache)
-        return zzz.WeaponDetail(**data)
+        data = await self._request_bytes(endpoint, use_cache)
+        return zzz.WeaponDetail.model_validate_json(data)
 
     async def fetch_bangboos(self, *, use_cache: bool = True) -> list[zzz.Bangboo]:
         """Fetch all Zenless Zone Zero bangboos.
@@ -150,8 +150,8 @@ class ZZZClient(BaseClient):
             The bangboo details object.
         """
         endpoint = f"bangboo/{bangboo_id}"
-        data = await self._request(endpoint, use_cache)
-        return zzz.BangbooDetail(**data)
+        data = await self._request_bytes(endpoint, use_cache)
+        return zzz.BangbooDetail.model_validate_json(data)
 
     async def fetch_drive_discs(self, *, use_cache: bool = True) -> list[zzz.DriveDisc]:
         """Fetch all Zenless Zone Zero drive discs.
@@ -167,16 +167,14 @@ class ZZZClient(BaseClient):
             zzz.DriveDisc(id=int(drive_disc_id), **drive_disc)
             for drive_disc_id, drive_disc in data.items()
         ]
+        info_attr = {
+            Language.EN: "en_info",
+            Language.KO: "ko_info",
+            Language.ZH: "chs_info",
+            Language.JA: "ja_info",
+        }[self.lang]
         for drive_disc in drive_discs:
-            if self.lang is Language.EN:
-                info = drive_disc.en_info
-            elif self.lang is Language.KO:
-                info = drive_disc.ko_info
-            elif self.lang is Language.ZH:
-                info = drive_disc.chs_info
-            else:
-                info = drive_disc.ja_info
-
+            info: zzz.DriveDiscInfo | None = getattr(drive_disc, info_attr)
             if info is None:
                 continue
 
@@ -199,8 +197,8 @@ class ZZZClient(BaseClient):
             The drive disc details object.
         """
         endpoint = f"equipment/{drive_disc_id}"
-        data = await self._request(endpoint, use_cache)
-        return zzz.DriveDiscDetail(**data)
+        data = await self._request_bytes(endpoint, use_cache)
+        return zzz.DriveDiscDetail.model_validate_json(data)
 
     async def fetch_items(self, *, use_cache: bool = True) -> Sequence[zzz.Item]:
         """Fetch all Zenless Zone Zero items.
@@ -53,69 +53,71 @@ ZZZ_LANG_MAP: Final[dict[Language, Literal["EN", "KO", "CHS", "JA"]]] = {
     Language.ZH: "CHS",
 }
 
-PERCENTAGE_FIGHT_PROPS: Final[set[str]] = {
-    "FIGHT_PROP_HP_PERCENT",
-    "FIGHT_PROP_ATTACK_PERCENT",
-    "FIGHT_PROP_DEFENSE_PERCENT",
-    "FIGHT_PROP_SPEED_PERCENT",
-    "FIGHT_PROP_CRITICAL",
-    "FIGHT_PROP_CRITICAL_HURT",
-    "FIGHT_PROP_CHARGE_EFFICIENCY",
-    "FIGHT_PROP_ADD_HURT",
-    "FIGHT_PROP_HEAL_ADD",
-    "FIGHT_PROP_HEALED_ADD",
-    "FIGHT_PROP_FIRE_ADD_HURT",
-    "FIGHT_PROP_WATER_ADD_HURT",
-    "FIGHT_PROP_GRASS_ADD_HURT",
-    "FIGHT_PROP_ELEC_ADD_HURT",
-    "FIGHT_PROP_ICE_ADD_HURT",
-    "FIGHT_PROP_WIND_ADD_HURT",
-    "FIGHT_PROP_PHYSICAL_ADD_HURT",
-    "FIGHT_PROP_ROCK_ADD_HURT",
-    "FIGHT_PROP_SKILL_CD_MINUS_RATIO",
-    "FIGHT_PROP_ATTACK_PERCENT_A",
-    "FIGHT_PROP_DEFENSE_PERCENT_A",
-    "FIGHT_PROP_HP_PERCENT_A",
-    "criticalChance",
-    "criticalDamage",
-    "breakDamageAddedRatio",
-    "breakDamageAddedRatioBase",
-    "healRatio",
-    "sPRatio",
-    "statusProbability",
-    "statusResistance",
-    "criticalChanceBase",
-    "criticalDamageBase",
-    "healRatioBase",
-    "sPRatioBase",
-    "statusProbabilityBase",
-    "statusResistanceBase",
-    "physicalAddedRatio",
-    "physicalResistance",
-    "fireAddedRatio",
-    "fireResistance",
-    "iceAddedRatio",
-    "iceResistance",
-    "thunderAddedRatio",
-    "thunderResistance",
-    "windAddedRatio",
-    "windResistance",
-    "quantumAddedRatio",
-    "quantumResistance",
-    "imaginaryAddedRatio",
-    "imaginaryResistance",
-    "hPAddedRatio",
-    "attackAddedRatio",
-    "defenceAddedRatio",
-    "healTakenRatio",
-    "physicalResistanceDelta",
-    "fireResistanceDelta",
-    "iceResistanceDelta",
-    "thunderResistanceDelta",
-    "windResistanceDelta",
-    "quantumResistanceDelta",
-    "imaginaryResistanceDelta",
-}
+PERCENTAGE_FIGHT_PROPS: Final[frozenset[str]] = frozenset(
+    {
+        "FIGHT_PROP_HP_PERCENT",
+        "FIGHT_PROP_ATTACK_PERCENT",
+        "FIGHT_PROP_DEFENSE_PERCENT",
+        "FIGHT_PROP_SPEED_PERCENT",
+        "FIGHT_PROP_CRITICAL",
+        "FIGHT_PROP_CRITICAL_HURT",
+        "FIGHT_PROP_CHARGE_EFFICIENCY",
+        "FIGHT_PROP_ADD_HURT",
+        "FIGHT_PROP_HEAL_ADD",
+        "FIGHT_PROP_HEALED_ADD",
+        "FIGHT_PROP_FIRE_ADD_HURT",
+        "FIGHT_PROP_WATER_ADD_HURT",
+        "FIGHT_PROP_GRASS_ADD_HURT",
+        "FIGHT_PROP_ELEC_ADD_HURT",
+        "FIGHT_PROP_ICE_ADD_HURT",
+        "FIGHT_PROP_WIND_ADD_HURT",
+        "FIGHT_PROP_PHYSICAL_ADD_HURT",
+        "FIGHT_PROP_ROCK_ADD_HURT",
+        "FIGHT_PROP_SKILL_CD_MINUS_RATIO",
+        "FIGHT_PROP_ATTACK_PERCENT_A",
+        "FIGHT_PROP_DEFENSE_PERCENT_A",
+        "FIGHT_PROP_HP_PERCENT_A",
+        "criticalChance",
+        "criticalDamage",
+        "breakDamageAddedRatio",
+        "breakDamageAddedRatioBase",
+        "healRatio",
+        "sPRatio",
+        "statusProbability",
+        "statusResistance",
+        "criticalChanceBase",
+        "criticalDamageBase",
+        "healRatioBase",
+        "sPRatioBase",
+        "statusProbabilityBase",
+        "statusResistanceBase",
+        "physicalAddedRatio",
+        "physicalResistance",
+        "fireAddedRatio",
+        "fireResistance",
+        "iceAddedRatio",
+        "iceResistance",
+        "thunderAddedRatio",
+        "thunderResistance",
+        "windAddedRatio",
+        "windResistance",
+        "quantumAddedRatio",
+        "quantumResistance",
+        "imaginaryAddedRatio",
+        "imaginaryResistance",
+        "hPAddedRatio",
+        "attackAddedRatio",
+        "defenceAddedRatio",
+        "healTakenRatio",
+        "physicalResistanceDelta",
+        "fireResistanceDelta",
+        "iceResistanceDelta",
+        "thunderResistanceDelta",
+        "windResistanceDelta",
+        "quantumResistanceDelta",
+        "imaginaryResistanceDelta",
+    }
+)
 """Set of fight props that should be displayed as percentage value."""
 
 HSR_PATH_NAMES: Final[dict[Language, dict[HSRPath, str]]] = {
@@ -174,20 +176,15 @@ STAT_TO_FIGHT_PROP: Final[dict[str, str]] = {
     "BaseATK": "FIGHT_PROP_BASE_ATTACK",
 }
 
-NOT_ASCENDED_LEVEL_TO_ASCENSION: Final[dict[Game, dict[int, int]]] = {
-    Game.GI: {80: 5, 70: 4, 60: 3, 50: 2, 40: 1, 20: 0},
-    Game.HSR: {70: 5, 60: 4, 50: 3, 40: 2, 30: 1, 20: 0},
-}
-
-ASCENDED_LEVEL_TO_ASCENSION: Final[dict[Game, dict[tuple[int, int], int]]] = {
-    Game.GI: {(80, 90): 6, (70, 80): 5, (60, 70): 4, (50, 60): 3, (40, 50): 2, (20, 40): 1},
-    Game.HSR: {(70, 80): 6, (60, 70): 5, (50, 60): 4, (40, 50): 3, (30, 40): 2, (20, 30): 1},
-}
-
 ASCENSION_TO_MAX_LEVEL: Final[dict[Game, dict[int, int]]] = {
     Game.GI: {0: 20, 1: 40, 2: 50, 3: 60, 4: 70, 5: 80, 6: 90},
     Game.HSR: {0: 20, 1: 30, 2: 40, 3: 50, 4: 60, 5: 70, 6: 80},
 }
 
+ASCENSION_MAX_LEVELS: Final[dict[Game, tuple[int, ...]]] = {
+    game: tuple(levels.values()) for game, levels in ASCENSION_TO_MAX_LEVEL.items()
+}
+"""Sorted max levels of each ascension phase, index is the ascension."""
+
 ZZZ_SAB_RARITY_CONVERTER: Final[dict[int, Literal["B", "A", "S"]]] = {2: "B", 3: "A", 4: "S"}
 ZZZ_SA_RARITY_CONVERTER: Final[dict[int, Literal["A", "S"]]] = {3: "A", 4: "S"}
@@ -1,31 +1,40 @@
 from __future__ import annotations
 
-from typing import Any, Self
+from typing import Any, ClassVar, Self
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, ConfigDict, model_validator
 
-from ..utils import cleanup_text, remove_ruby_tags, replace_device_params
+from ..utils import format_model_text
 
 
 class APIModel(BaseModel):
     """Base class for all models in hakushin-py."""
 
+    # Build validators on first use, most programs only touch one game's models.
+    model_config = ConfigDict(defer_build=True)
+
+    _text_fields: ClassVar[tuple[str, ...]] = ()
+    """Names of the fields cleaned up by _format_fields, computed per subclass."""
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:  # noqa: PLW3201
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._text_fields = tuple(
+            name for name in ("name", "description", "story") if name in cls.model_fields
+        )
+
     @property
     def fields(self) -> dict[str, Any]:
         """Return all fields of the model as a dictionary."""
-        schema = self.model_fields
-        field_names = schema.keys()
-        field_values = {name: getattr(self, name) for name in field_names}
-        return field_values
+        return {name: getattr(self, name) for name in type(self).model_fields}
 
     @model_validator(mode="after")
     def _format_fields(self) -> Self:
-        for field_name, field_value in self.fields.items():
-            if field_name in {"name", "description", "story"} and isinstance(field_value, str):
-                setattr(
-                    self,
-                    field_name,
-                    replace_device_params(remove_ruby_tags(cleanup_text(field_value))),
-                )
+        for field_name in self._text_fields:
+            field_value = getattr(self, field_name)
+            if isinstance(field_value, str):
+                # Bypass BaseModel.__setattr__, the value is already validated.
+                object.__setattr__(self, field_name, format_model_text(field_value))  # noqa: PLC2801
+                self.__pydantic_fields_set__.add(field_name)
 
         return self
@@ -5,6 +5,7 @@ from typing import Any, Literal
 from pydantic import Field, field_validator, model_validator
 
 from ..base import APIModel
+from .common import GIIcon
 
 __all__ = (
     "Artifact",
@@ -37,27 +38,19 @@ class ArtifactSetDetailSetEffects(APIModel):
 class Artifact(APIModel):
     """Genshin Impact artifact."""
 
-    icon: str = Field(alias="Icon")
+    icon: GIIcon = Field(alias="Icon")
     name: str = Field(alias="Name")
     description: str = Field(alias="Desc")
 
-    @field_validator("icon", mode="before")
-    def _convert_icon(cls, value: str) -> str:
-        return f"https://api.hakush.in/gi/UI/{value}.webp"
-
 
 class ArtifactSetDetail(APIModel):
     """Genshin Impact artifact set detail."""
 
     id: int = Field(alias="Id")
-    icon: str = Field(alias="Icon")
+    icon: GIIcon = Field(alias="Icon")
     set_effect: ArtifactSetDetailSetEffects = Field(alias="Affix")
     parts: dict[str, Artifact] = Field(alias="Parts")
 
-    @field_validator("icon", mode="before")
-    def _convert_icon(cls, value: str) -> str:
-        return f"https://api.hakush.in/gi/UI/{value}.webp"
-
     @field_validator("set_effect", mode="before")
     def _assign_set_effect(cls, value: list[dict[str, Any]]) -> dict[str, Any]:
         return {"two_piece": value[0], "four_piece": value[1] if len(value) > 1 else None}
@@ -88,16 +81,12 @@ class ArtifactSet(APIModel):
     """Genshin Impact artifact set."""
 
     id: int
-    icon: str
+    icon: GIIcon
     rarities: list[int] = Field(alias="rank")
     set_effect: ArtifactSetEffects = Field(alias="set")
     names: dict[Literal["EN", "KR", "CHS", "JP"], str]
     name: str = Field("")  # The value of this field is assigned in post processing.
 
-    @field_validator("icon", mode="before")
-    def _convert_icon(cls, value: str) -> str:
-        return f"https://api.hakush.in/gi/UI/{value}.webp"
-
     @field_validator("set_effect", mode="before")
     def _assign_set_effects(cls, value: dict[str, Any]) -> dict[str, Any]:
         return {
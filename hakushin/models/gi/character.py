@@ -7,6 +7,7 @@ from pydantic import Field, field_validator, model_validator
 from ...constants import GI_CHARA_RARITY_MAP
 from ...enums import GIElement
 from ..base import APIModel
+from .common import GIIcon
 
 __all__ = (
     "Character",
@@ -31,11 +32,7 @@ class Namecard(APIModel):
     id: int = Field(alias="Id")
     name: str = Field(alias="Name")
     description: str = Field(alias="Desc")
-    icon: str = Field(alias="Icon")
-
-    @field_validator("icon", mode="before")
-    def _convert_icon(cls, value: str) -> str:
-        return f"https://api.hakush.in/gi/UI/{value}.webp"
+    icon: GIIcon = Field(alias="Icon")
 
 
 class CharacterInfo(APIModel):
@@ -52,17 +49,13 @@ class SkillUpgradeInfo(APIModel):
     """Character's skill upgrade information."""
 
     level: int = Field(alias="Level")
-    icon: str = Field(alias="Icon")
+    icon: GIIcon = Field(alias="Icon")
     attributes: list[str] = Field(alias="Desc")
     parameters: list[float] = Field(alias="Param")
 
-    @field_validator("icon", mode="before")
-    def _convert_icon(cls, value: str) -> str:
-        return f"https://api.hakush.in/gi/UI/{value}.webp"
-
     @field_validator("attributes", mode="before")
     def _remove_empty_attributes(cls, value: list[str]) -> list[str]:
-        return [attr for attr in value if attr]
+        return value if all(value) else [attr for attr in value if attr]
 
 
 class CharacterSkill(APIModel):
@@ -80,11 +73,7 @@ class CharacterPassive(APIModel):
     description: str = Field(alias="Desc")
     unlock: int = Field(alias="Unlock")
     parameters: list[float] = Field(alias="ParamList")
-    icon: str = Field(alias="Icon")
-
-    @field_validator("icon", mode="before")
-    def _convert_icon(cls, value: str) -> str:
-        return f"https://api.hakush.in/gi/UI/{value}.webp"
+    icon: GIIcon = Field(alias="Icon")
 
 
 class CharacterConstellation(APIModel):
@@ -93,11 +82,7 @@ class CharacterConstellation(APIModel):
     name: str = Field(alias="Name")
     description: str = Field(alias="Desc")
     parameters: list[float] = Field(alias="ParamList")
-    icon: str = Field(alias="Icon")
-
-    @field_validator("icon", mode="before")
-    def _convert_icon(cls, value: str) -> str:
-        return f"https://api.hakush.in/gi/UI/{value}.webp"
+    icon: GIIcon = Field(alias="Icon")
 
 
 class UpgradeMaterial(APIModel):
@@ -153,7 +138,7 @@ class CharacterDetail(APIModel):
     description: str = Field(alias="Desc")
     info: CharacterInfo = Field(alias="CharaInfo")
     rarity: Literal[4, 5] = Field(alias="Rarity")
-    icon: str = Field(alias="Icon")
+    icon: GIIcon = Field(alias="Icon")
 
     # Combat
     skills: list[CharacterSkill] = Field(alias="Skills")
@@ -176,10 +161,6 @@ class CharacterDetail(APIModel):
         """Character's gacha art URL."""
         return self.icon.replace("AvatarIcon", "Gacha_AvatarImg")
 
-    @field_validator("icon", mode="before")
-    def _convert_icon(cls, value: str) -> str:
-        return f"https://api.hakush.in/gi/UI/{value}.webp"
-
     @field_validator("rarity", mode="before")
     def _convert_rarity(cls, value: str) -> Literal[4, 5]:
         return GI_CHARA_RARITY_MAP[value]
@@ -189,24 +170,21 @@ class Character(APIModel):
     """Genshin Impact character."""
 
     id: str  # This field is not present in the API response.
-    icon: str
+    icon: GIIcon
     rarity: Literal[4, 5] = Field(alias="rank")
     description: str = Field(alias="desc")
     element: GIElement | None = None
     names: dict[Literal["EN", "CHS", "KR", "JP"], str]
     name: str = Field("")  # This value of this field is assigned in post processing.
 
-    @field_validator("icon", mode="before")
-    def _convert_icon(cls, value: str) -> str:
-        return f"https://api.hakush.in/gi/UI/{value}.webp"
-
     @field_validator("rarity", mode="before")
     def _convert_rarity(cls, value: str) -> Literal[4, 5]:
         return GI_CHARA_RARITY_MAP[value]
 
     @field_validator("element", mode="before")
-    def _convert_element(cls, value: str) -> GIElement | None:
-        return GIElement(value) if value else None
+    def _convert_element(cls, value: str) -> str | None:
+        # The enum conversion itself is left to pydantic-core.
+        return value or None
 
     @model_validator(mode="before")
     def _transform_names(cls, values: dict[str, Any]) -> dict[str, Any]:
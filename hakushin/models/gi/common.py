@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import functools
+from typing import Annotated
+
+from pydantic import BeforeValidator
+
+__all__ = ()
+
+
+@functools.lru_cache(maxsize=2048)
+def gi_icon_url(icon: str) -> str:
+    """Return the URL of a Genshin Impact UI icon.
+
+    Icons repeat across models and languages, so the URLs are cached and equal icons
+    share a single string.
+
+    Args:
+        icon: The icon name from the API, e.g. `UI_AvatarIcon_Ayaka`.
+    """
+    return f"https://api.hakush.in/gi/UI/{icon}.webp"
+
+
+GIIcon = Annotated[str, BeforeValidator(gi_icon_url)]
+"""Icon field that turns the icon name from the API into its full URL."""
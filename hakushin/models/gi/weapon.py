@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import Field, model_validator
 
 from ..base import APIModel
+from .common import GIIcon
 
 __all__ = ("Weapon", "WeaponDetail", "WeaponProperty", "WeaponRefinement", "WeaponStatModifier")
 
@@ -38,32 +39,24 @@ class WeaponDetail(APIModel):
     name: str = Field(alias="Name")
     description: str = Field(alias="Desc")
     rarity: Literal[1, 2, 3, 4, 5] = Field(alias="Rarity")
-    icon: str = Field(alias="Icon")
+    icon: GIIcon = Field(alias="Icon")
 
     stat_modifiers: dict[str, WeaponStatModifier] = Field(alias="StatsModifier")
     xp_requirements: dict[str, float] = Field(alias="XPRequirements")
     ascension: dict[str, dict[str, float]] = Field(alias="Ascension")
     refinments: dict[str, WeaponRefinement] = Field(alias="Refinement")
 
-    @field_validator("icon", mode="before")
-    def _convert_icon(cls, value: str) -> str:
-        return f"https://api.hakush.in/gi/UI/{value}.webp"
-
 
 class Weapon(APIModel):
     """Genshin Impact weapon."""
 
     id: int  # This field is not present in the API response.
-    icon: str
+    icon: GIIcon
     rarity: Literal[1, 2, 3, 4, 5] = Field(alias="rank")
     description: str = Field(alias="desc")
     names: dict[Literal["EN", "CHS", "KR", "JP"], str]
     name: str = Field("")  # This value of this field is assigned in post processing.
 
-    @field_validator("icon", mode="before")
-    def _convert_icon(cls, value: str) -> str:
-        return f"https://api.hakush.in/gi/UI/{value}.webp"
-
     @model_validator(mode="before")
     def _transform_names(cls, values: dict[str, Any]) -> dict[str, Any]:
         values["names"] = {
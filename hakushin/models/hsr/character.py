@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
-from pydantic import Field, computed_field, field_validator, model_validator
+from pydantic import AliasPath, Field, computed_field, field_validator, model_validator
 
 from ...constants import HSR_CHARA_RARITY_MAP
 from ...enums import HSRElement, HSRPath
@@ -55,7 +55,8 @@ class Eidolon(APIModel):
 class CharacterDetail(APIModel):
     """HSR character detail."""
 
-    id: int = Field(alias="Id")
+    # The API has no ID field, take it from the relic recommendation.
+    id: int = Field(validation_alias=AliasPath("Relics", "AvatarID"), serialization_alias="Id")
     name: str = Field(alias="Name")
     description: str = Field(alias="Desc")
     rarity: Literal[4, 5] = Field(alias="Rarity")
@@ -67,15 +68,6 @@ class CharacterDetail(APIModel):
     def _convert_rarity(cls, value: str) -> Literal[4, 5]:
         return HSR_CHARA_RARITY_MAP[value]
 
-    @model_validator(mode="before")
-    def _extract_id(cls, values: dict[str, Any]) -> dict[str, Any]:
-        """Use a hacky way to extract character ID from relic recommendation.
-
-        I don't understand why the API doesn't have the character ID in the response.
-        """
-        values["Id"] = values["Relics"]["AvatarID"]
-        return values
-
     @property
     def icon(self) -> str:
         """Character's icon URL."""
@@ -84,7 +76,7 @@ class CharacterDetail(APIModel):
     @property
     def gacha_art(self) -> str:
         """Character's gacha art URL."""
-        return self.icon.replace("avatarshopicon", "avatardrawcard")
+        return f"https://api.hakush.in/hsr/UI/avatardrawcard/{self.id}.webp"
 
 
 class Character(APIModel):
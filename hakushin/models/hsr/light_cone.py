@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
-from pydantic import Field, computed_field, field_validator, model_validator
+from pydantic import AliasPath, Field, computed_field, field_validator, model_validator
 
 from ...constants import HSR_LIGHT_CONE_RARITY_MAP
 from ...enums import HSRPath
@@ -30,7 +30,8 @@ class SuperimposeInfo(APIModel):
 class LightConeDetail(APIModel):
     """HSR light cone detail."""
 
-    id: int = Field(alias="Id")
+    # The API has no ID field, take it from the ascension stats.
+    id: int = Field(validation_alias=AliasPath("Stats", 0, "EquipmentID"), serialization_alias="Id")
     name: str = Field(alias="Name")
     description: str = Field(alias="Desc")
     path: HSRPath = Field(alias="BaseType")
@@ -42,15 +43,6 @@ class LightConeDetail(APIModel):
     def _convert_rarity(cls, value: str) -> Literal[3, 4, 5]:
         return HSR_LIGHT_CONE_RARITY_MAP[value]
 
-    @model_validator(mode="before")
-    def _extract_id(cls, values: dict[str, Any]) -> dict[str, Any]:
-        """Use a hacky way to extract LC ID from relic recommendation.
-
-        I don't understand why the API doesn't have the LC ID in the response.
-        """
-        values["Id"] = values["Stats"][0]["EquipmentID"]
-        return values
-
     @computed_field
     @property
     def icon(self) -> str:
@@ -61,7 +53,7 @@ class LightConeDetail(APIModel):
     @property
     def image(self) -> str:
         """Light cone's image URL."""
-        return self.icon.replace("lightconemediumicon", "lightconemaxfigures")
+        return f"https://api.hakush.in/hsr/UI/lightconemaxfigures/{self.id}.webp"
 
 
 class LightCone(APIModel):
@@ -80,10 +72,6 @@ class LightCone(APIModel):
         """Light cone's icon URL."""
         return f"https://api.hakush.in/hsr/UI/lightconemediumicon/{self.id}.webp"
 
-    @field_validator("icon", mode="before")
-    def _convert_icon(cls, value: str) -> str:
-        return f"https://api.hakush.in/hsr/UI/avatarshopicon/{value}.webp"
-
     @field_validator("rarity", mode="before")
     def _convert_rarity(cls, value: str) -> Literal[3, 4, 5]:
         return HSR_LIGHT_CONE_RARITY_MAP[value]
@@ -72,7 +72,7 @@ class RelicSetDetail(APIModel):
 
     @field_validator("parts", mode="before")
     def _convert_parts(cls, value: dict[str, Any]) -> dict[str, Any]:
-        return {key: Relic(id=int(key), **value[key]) for key in value}
+        return {key: {**value[key], "id": key} for key in value}
 
 
 class RelicSetEffect(APIModel):
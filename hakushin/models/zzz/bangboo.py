@@ -7,7 +7,7 @@ from pydantic import Field, field_validator, model_validator
 from ...constants import ZZZ_SA_RARITY_CONVERTER
 from ...utils import cleanup_text
 from ..base import APIModel
-from .common import ZZZExtraProp, ZZZMaterial
+from .common import ZZZExtraProp, ZZZIcon, ZZZMaterial
 
 __all__ = ("Bangboo", "BangbooAscension", "BangbooDetail", "BangbooSkill")
 
@@ -16,19 +16,13 @@ class Bangboo(APIModel):
     """ZZZ bangboo model."""
 
     id: int
-    icon: str
+    icon: ZZZIcon
     rarity: Literal["S", "A"] | None = Field(alias="rank")
     code_name: str = Field(alias="codename")
     description: str = Field(alias="desc")
     name: str = Field("")  # This field doesn't exist in the API response
     names: dict[Literal["EN", "JA", "CHS", "KO"], str]
 
-    @field_validator("icon")
-    @classmethod
-    def __convert_icon(cls, value: str) -> str:
-        value = value.split("/")[-1].split(".")[0]
-        return f"https://api.hakush.in/zzz/UI/{value}.webp"
-
     @field_validator("rarity", mode="before")
     @classmethod
     def __convert_rarity(cls, value: int | None) -> Literal["S", "A"] | None:
@@ -59,13 +53,13 @@ class BangbooAscension(APIModel):
 
     @field_validator("extra_props", mode="before")
     @classmethod
-    def __convert_extra_props(cls, value: dict[str, dict[str, Any]]) -> list[ZZZExtraProp]:
-        return [ZZZExtraProp(**prop) for prop in value.values()]
+    def __convert_extra_props(cls, value: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+        return list(value.values())
 
     @field_validator("materials", mode="before")
     @classmethod
-    def __convert_materials(cls, value: dict[str, int]) -> list[ZZZMaterial]:
-        return [ZZZMaterial(id=int(id_), amount=amount) for id_, amount in value.items()]
+    def __convert_materials(cls, value: dict[str, int]) -> list[dict[str, Any]]:
+        return [{"id": id_, "amount": amount} for id_, amount in value.items()]
 
 
 class BangbooSkill(APIModel):
@@ -90,7 +84,7 @@ class BangbooDetail(APIModel):
     name: str = Field(alias="Name")
     description: str = Field(alias="Desc")
     rarity: Literal["S", "A"] = Field(alias="Rarity")
-    icon: str = Field(alias="Icon")
+    icon: ZZZIcon = Field(alias="Icon")
     stats: dict[str, float] = Field(alias="Stats")
     ascensions: dict[str, BangbooAscension] = Field(alias="Level")
     """Dictionary of ascension objects, key starts from 1."""
@@ -103,12 +97,6 @@ class BangbooDetail(APIModel):
     ) -> dict[Literal["A", "B", "C"], dict[str, BangbooSkill]]:
         return {key: value[key]["Level"] for key in value}
 
-    @field_validator("icon")
-    @classmethod
-    def __convert_icon(cls, value: str) -> str:
-        value = value.split("/")[-1].split(".")[0]
-        return f"https://api.hakush.in/zzz/UI/{value}.webp"
-
     @field_validator("rarity", mode="before")
     @classmethod
     def __convert_rarity(cls, value: int) -> Literal["S", "A"]:
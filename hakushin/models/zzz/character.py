@@ -166,8 +166,8 @@ class CharacterAscension(APIModel):
 
     @field_validator("materials", mode="before")
     @classmethod
-    def __convert_materials(cls, value: dict[str, int]) -> list[ZZZMaterial]:
-        return [ZZZMaterial(id=int(k), amount=v) for k, v in value.items()]
+    def __convert_materials(cls, value: dict[str, int]) -> list[dict[str, Any]]:
+        return [{"id": k, "amount": v} for k, v in value.items()]
 
 
 class CharacterExtraAscension(APIModel):
@@ -178,8 +178,8 @@ class CharacterExtraAscension(APIModel):
 
     @field_validator("props", mode="before")
     @classmethod
-    def __convert_props(cls, value: dict[str, dict[str, Any]]) -> list[ZZZExtraProp]:
-        return [ZZZExtraProp(**data) for data in value.values()]
+    def __convert_props(cls, value: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+        return list(value.values())
 
 
 class CharaSkillDescParamProp(APIModel):
@@ -215,11 +215,10 @@ class CharacterSkill(APIModel):
 
     @field_validator("materials", mode="before")
     @classmethod
-    def __convert_materials(cls, value: dict[str, dict[str, int]]) -> dict[str, list[ZZZMaterial]]:
-        return {
-            k: [ZZZMaterial(id=int(k), amount=v) for k, v in data.items()]
-            for k, data in value.items()
-        }
+    def __convert_materials(
+        cls, value: dict[str, dict[str, int]]
+    ) -> dict[str, list[dict[str, Any]]]:
+        return {k: [{"id": k, "amount": v} for k, v in data.items()] for k, data in value.items()}
 
 
 class CharaCoreSkillLevel(APIModel):
@@ -245,16 +244,10 @@ class CharacterCoreSkill(APIModel):
 
     @field_validator("level_up_materials", mode="before")
     @classmethod
-    def __convert_materials(cls, value: dict[str, dict[str, int]]) -> dict[str, list[ZZZMaterial]]:
-        return {
-            k: [ZZZMaterial(id=int(k), amount=v) for k, v in data.items()]
-            for k, data in value.items()
-        }
-
-    @field_validator("levels", mode="before")
-    @classmethod
-    def __intify_keys(cls, value: dict[str, dict[str, Any]]) -> dict[int, CharaCoreSkillLevel]:
-        return {int(k): CharaCoreSkillLevel(**v) for k, v in value.items()}
+    def __convert_materials(
+        cls, value: dict[str, dict[str, int]]
+    ) -> dict[str, list[dict[str, Any]]]:
+        return {k: [{"id": k, "amount": v} for k, v in data.items()] for k, data in value.items()}
 
 
 class CharacterDetail(APIModel):
@@ -316,34 +309,30 @@ class CharacterDetail(APIModel):
 
     @field_validator("info", mode="before")
     @classmethod
-    def __convert_info(cls, value: dict[str, Any]) -> CharacterInfo | None:
-        return None if not value else CharacterInfo(**value)
+    def __convert_info(cls, value: dict[str, Any]) -> dict[str, Any] | None:
+        return value or None
 
     @field_validator("skills", mode="before")
     @classmethod
     def __convert_skills(
         cls, value: dict[str, dict[str, Any]]
-    ) -> dict[ZZZSkillType, CharacterSkill]:
-        return {
-            ZZZSkillType(k): CharacterSkill(Type=ZZZSkillType(k), **v) for k, v in value.items()
-        }
+    ) -> dict[ZZZSkillType, dict[str, Any]]:
+        return {ZZZSkillType(k): {**v, "Type": ZZZSkillType(k)} for k, v in value.items()}
 
     @field_validator("extra_ascension", mode="before")
     @classmethod
-    def __convert_extra_ascension(
-        cls, value: dict[str, dict[str, Any]]
-    ) -> list[CharacterExtraAscension]:
-        return [CharacterExtraAscension(**data) for data in value.values()]
+    def __convert_extra_ascension(cls, value: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+        return list(value.values())
 
     @field_validator("ascension", mode="before")
     @classmethod
-    def __convert_ascension(cls, value: dict[str, dict[str, Any]]) -> list[CharacterAscension]:
-        return [CharacterAscension(**data) for data in value.values()]
+    def __convert_ascension(cls, value: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+        return list(value.values())
 
     @field_validator("mindscape_cinemas", mode="before")
     @classmethod
-    def __dict_to_list(cls, value: dict[str, dict[str, Any]]) -> list[MindscapeCinema]:
-        return [MindscapeCinema(**data) for data in value.values()]
+    def __dict_to_list(cls, value: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+        return list(value.values())
 
     @field_validator("stats", mode="before")
     @classmethod
@@ -1,12 +1,30 @@
 from __future__ import annotations
 
-from pydantic import Field, computed_field
+import functools
+from typing import Annotated
+
+from pydantic import AfterValidator, Field, computed_field
 
 from ..base import APIModel
 
 __all__ = ("ZZZExtraProp", "ZZZMaterial")
 
 
+@functools.lru_cache(maxsize=2048)
+def zzz_icon_url(icon: str) -> str:
+    """Return the URL of a Zenless Zone Zero UI icon.
+
+    Args:
+        icon: The icon path from the API, only its file name without the extension is used.
+    """
+    filename = icon.rsplit("/", maxsplit=1)[-1].split(".", maxsplit=1)[0]
+    return f"https://api.hakush.in/zzz/UI/{filename}.webp"
+
+
+ZZZIcon = Annotated[str, AfterValidator(zzz_icon_url)]
+"""Icon field that turns the icon path from the API into its full URL."""
+
+
 class ZZZMaterial(APIModel):
     """Generic ZZZ material."""
 
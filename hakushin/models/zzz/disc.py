@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from pydantic import Field, field_validator
+from pydantic import Field
 
 from ..base import APIModel
+from .common import ZZZIcon
 
 __all__ = ("DriveDisc", "DriveDiscDetail", "DriveDiscInfo")
 
@@ -19,7 +20,7 @@ class DriveDisc(APIModel):
     """ZZZ drive disc model."""
 
     id: int
-    icon: str
+    icon: ZZZIcon
     name: str = Field("")  # This field doesn't exist in the API response
     two_piece_effect: str = Field("")  # Same here
     four_piece_effect: str = Field("")  # Same here
@@ -29,12 +30,6 @@ class DriveDisc(APIModel):
     chs_info: DriveDiscInfo = Field(alias="CHS")
     ja_info: DriveDiscInfo | None = Field(None, alias="JA")
 
-    @field_validator("icon")
-    @classmethod
-    def __convert_icon(cls, icon: str) -> str:
-        filename = icon.split("/")[-1].split(".")[0]
-        return f"https://api.hakush.in/zzz/UI/{filename}.webp"
-
 
 class DriveDiscDetail(APIModel):
     """ZZZ drive disc detail model."""
@@ -44,10 +39,4 @@ class DriveDiscDetail(APIModel):
     two_piece_effect: str = Field(alias="Desc2")
     four_piece_effect: str = Field(alias="Desc4")
     story: str = Field(alias="Story")
-    icon: str = Field(alias="Icon")
-
-    @field_validator("icon")
-    @classmethod
-    def __convert_icon(cls, icon: str) -> str:
-        filename = icon.split("/")[-1].split(".")[0]
-        return f"https://api.hakush.in/zzz/UI/{filename}.webp"
+    icon: ZZZIcon = Field(alias="Icon")
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import Field, field_validator
+from pydantic import Field
 
 from ..base import APIModel
+from .common import ZZZIcon
 
 __all__ = ("Item",)
 
@@ -12,14 +13,8 @@ __all__ = ("Item",)
 class Item(APIModel):
     """ZZZ item model."""
 
-    icon: str
+    icon: ZZZIcon
     rarity: Literal[1, 2, 3, 4, 5] = Field(alias="rank")
     class_: int = Field(alias="class")
     name: str
     id: int
-
-    @field_validator("icon", mode="before")
-    @classmethod
-    def __convert_icon(cls, value: str) -> str:
-        icon = value.split("/")[-1].split(".")[0]
-        return f"https://api.hakush.in/zzz/UI/{icon}.webp"
@@ -8,6 +8,7 @@ from ...constants import ZZZ_SAB_RARITY_CONVERTER
 from ...enums import ZZZSpecialty
 from ...utils import cleanup_text
 from ..base import APIModel
+from .common import ZZZIcon
 
 __all__ = (
     "Weapon",
@@ -113,7 +114,7 @@ class WeaponDetail(APIModel):
     description2: str = Field(alias="Desc2")
     short_description: str = Field(alias="Desc3")
     rarity: Literal["S", "A", "B"] | None = Field(alias="Rarity")
-    icon: str = Field(alias="Icon")
+    icon: ZZZIcon = Field(alias="Icon")
     type: WeaponType = Field(alias="WeaponType")
     base_property: WeaponProp = Field(alias="BaseProperty")
     rand_property: WeaponProp = Field(alias="RandProperty")
@@ -125,15 +126,9 @@ class WeaponDetail(APIModel):
 
     @field_validator("type", mode="before")
     @classmethod
-    def __convert_type(cls, value: dict[str, str]) -> WeaponType:
-        first_item = next(iter(value.items()))
-        return WeaponType(type=ZZZSpecialty(int(first_item[0])), name=first_item[1])
-
-    @field_validator("icon")
-    @classmethod
-    def __convert_icon(cls, value: str) -> str:
-        value = value.split("/")[-1].split(".")[0]
-        return f"https://api.hakush.in/zzz/UI/{value}.webp"
+    def __convert_type(cls, value: dict[str, str]) -> dict[str, str]:
+        type_, name = next(iter(value.items()))
+        return {"type": type_, "name": name}
 
     @field_validator("rarity", mode="before")
     @classmethod
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
+import bisect
 import re
 from typing import TYPE_CHECKING, TypeVar
 
 from .constants import (
-    ASCENDED_LEVEL_TO_ASCENSION,
+    ASCENSION_MAX_LEVELS,
     ASCENSION_TO_MAX_LEVEL,
-    NOT_ASCENDED_LEVEL_TO_ASCENSION,
     PERCENTAGE_FIGHT_PROPS,
     STAT_TO_FIGHT_PROP,
 )
@@ -15,6 +15,12 @@ from .enums import Game
 if TYPE_CHECKING:
     from .models import gi, hsr
 
+_CLEANUP_TEXT_RE = re.compile(r"<.*?>|\{SPRITE_PRESET#[^\}]+\}")
+_RUBY_END_RE = re.compile(r"\{RUBY_E#\}")
+_RUBY_BEGIN_RE = re.compile(r"\{RUBY_B#.*?\}")
+_CONTROLLER_LAYOUT_RE = re.compile(r"{LAYOUT_CONSOLECONTROLLER#(.*?)}")
+_FALLBACK_LAYOUT_RE = re.compile(r"{LAYOUT_FALLBACK#(.*?)}")
+
 
 def format_num(digits: int, calculation: float) -> str:
     """Format a number to a string with a fixed number of digits after the decimal point.
@@ -86,10 +92,10 @@ def replace_params(text: str, param_list: list[float]) -> list[str]:
 def replace_device_params(text: str) -> str:
     """Replace device parameters in a string with the corresponding values."""
     # Replace '{LAYOUT_CONSOLECONTROLLER#stick}' with 'stick/'
-    text = re.sub(r"{LAYOUT_CONSOLECONTROLLER#(.*?)}", r"\1/", text)
+    text = _CONTROLLER_LAYOUT_RE.sub(r"\1/", text)
 
     # Replace '{LAYOUT_FALLBACK#joystick}' with 'joystick'
-    text = re.sub(r"{LAYOUT_FALLBACK#(.*?)}", r"\1", text)
+    text = _FALLBACK_LAYOUT_RE.sub(r"\1", text)
 
     return text
 
@@ -103,8 +109,7 @@ def cleanup_text(text: str) -> str:
     Returns:
         str: The cleaned text.
     """
-    clean = re.compile(r"<.*?>|\{SPRITE_PRESET#[^\}]+\}")
-    return re.sub(clean, "", text).replace("\\n", "\n").replace("\r\n", "\n")
+    return _CLEANUP_TEXT_RE.sub("", text).replace("\\n", "\n").replace("\r\n", "\n")
 
 
 def replace_placeholders(text: str, param_list: list[float]) -> str:
@@ -132,14 +137,16 @@ def replace_placeholders(text: str, param_list: list[float]) -> str:
 
 def get_ascension_from_level(level: int, ascended: bool, game: Game) -> int:
     """Get the ascension from the level and ascended status."""
-    if not ascended and level in NOT_ASCENDED_LEVEL_TO_ASCENSION[game]:
-        return NOT_ASCENDED_LEVEL_TO_ASCENSION[game][level]
-
-    for (start, end), ascension in ASCENDED_LEVEL_TO_ASCENSION[game].items():
-        if start <= level <= end:
-            return ascension
+    max_levels = ASCENSION_MAX_LEVELS[game]
+    if not max_levels[0] <= level <= max_levels[-1]:
+        return 0
 
-    return 0
+    # Number of ascension phases whose max level has been reached.
+    ascension = bisect.bisect_right(max_levels, level, hi=len(max_levels) - 1)
+    if not ascended and max_levels[ascension - 1] == level:
+        # At the max level of the previous phase but not ascended yet.
+        return ascension - 1
+    return ascension
 
 
 def get_max_level_from_ascension(ascension: int, game: Game) -> int:
@@ -169,9 +176,7 @@ def calc_gi_chara_upgrade_stat_values(
     ascension = character.stats_modifier.ascension[ascension - 1]
     for fight_prop, value in ascension.items():
         stat = STAT_TO_FIGHT_PROP.get(fight_prop, fight_prop)
-        if stat not in result:
-            result[stat] = 0
-        result[stat] += value
+        result[stat] = result.get(stat, 0) + value
 
     return result
 
@@ -316,7 +321,24 @@ def get_skill_attributes(descriptions: list[str], params: list[int | float]) ->
 def remove_ruby_tags(text: str) -> str:
     """Remove ruby tags from a string."""
     # Remove {RUBY_E#} tags
-    text = re.sub(r"\{RUBY_E#\}", "", text)
+    text = _RUBY_END_RE.sub("", text)
     # Remove {RUBY_B...} tags
-    text = re.sub(r"\{RUBY_B#.*?\}", "", text)
-    return text
+    return _RUBY_BEGIN_RE.sub("", text)
+
+
+def format_model_text(text: str) -> str:
+    """Clean up a model's text.
+
+    Same as `replace_device_params(remove_ruby_tags(cleanup_text(text)))`, but skips the
+    regex passes when the text has no markup.
+
+    Args:
+        text (str): The text to format.
+
+    Returns:
+        str: The formatted text.
+    """
+    # Every pattern starts with "<" or "{", most names and descriptions have neither.
+    if "<" not in text and "{" not in text:
+        return text.replace("\\n", "\n").replace("\r\n", "\n")
+    return replace_device_params(remove_ruby_tags(cleanup_text(text)))
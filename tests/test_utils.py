@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import pytest
+
+from hakushin.enums import Game
+from hakushin.utils import format_model_text, get_ascension_from_level
+
+
+# Expected output of the cleanup chain models used before format_model_text.
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("", ""),
+        ("Plain name", "Plain name"),
+        ("Line one\\nLine two", "Line one\nLine two"),
+        ("Line one\r\nLine two", "Line one\nLine two"),
+        ("<color=#FFD780FF>Pyro DMG</color> Bonus", "Pyro DMG Bonus"),
+        ("Press {SPRITE_PRESET#11110} to jump", "Press  to jump"),
+        ("{RUBY_B#ruby}Kanji{RUBY_E#}", "Kanji"),
+        ("Move {LAYOUT_CONSOLECONTROLLER#stick}{LAYOUT_FALLBACK#joystick}", "Move stick/joystick"),
+        ("{LAYOUT_FALLBACK#{RUBY_B#x}y{RUBY_E#}}", "y"),
+        ("{LAYOUT_CONSOLECONTROLLER#{SPRITE_PRESET#1}}", "/"),
+        ("{LAYOUT_FALLBACK#<i>tap</i>}", "tap"),
+        ("a\r{RUBY_E#}\nb", "a\r\nb"),
+        ("a\r<b></b>\nb", "a\nb"),
+        ("Unclosed {brace and < angle", "Unclosed {brace and < angle"),
+        ("{RUBY_B#a{RUBY_E#}", "{RUBY_B#a"),
+        ("{RUBY_B#x{RUBY_E#}}", ""),
+    ],
+)
+def test_format_model_text(text: str, expected: str) -> None:
+    assert format_model_text(text) == expected
+
+
+# Lookup tables get_ascension_from_level used before it switched to bisect.
+NOT_ASCENDED_LEVEL_TO_ASCENSION = {
+    Game.GI: {80: 5, 70: 4, 60: 3, 50: 2, 40: 1, 20: 0},
+    Game.HSR: {70: 5, 60: 4, 50: 3, 40: 2, 30: 1, 20: 0},
+}
+ASCENDED_LEVEL_TO_ASCENSION = {
+    Game.GI: {(80, 90): 6, (70, 80): 5, (60, 70): 4, (50, 60): 3, (40, 50): 2, (20, 40): 1},
+    Game.HSR: {(70, 80): 6, (60, 70): 5, (50, 60): 4, (40, 50): 3, (30, 40): 2, (20, 30): 1},
+}
+
+
+def _expected_ascension(level: int, ascended: bool, game: Game) -> int:
+    if not ascended and level in NOT_ASCENDED_LEVEL_TO_ASCENSION[game]:
+        return NOT_ASCENDED_LEVEL_TO_ASCENSION[game][level]
+
+    for (start, end), ascension in ASCENDED_LEVEL_TO_ASCENSION[game].items():
+        if start <= level <= end:
+            return ascension
+
+    return 0
+
+
+@pytest.mark.parametrize("game", [Game.GI, Game.HSR])
+@pytest.mark.parametrize("ascended", [False, True])
+@pytest.mark.parametrize("level", range(-5, 120))
+def test_get_ascension_from_level(level: int, ascended: bool, game: Game) -> None:
+    assert get_ascension_from_level(level, ascended, game) == _expected_ascension(
+        level, ascended, game
+    )